@@ -11,26 +11,51 @@ https://checkoutfinland.github.io/psp-api/#/
 import logging
 import requests
 import hmac
-import six
-
-from datetime import datetime
+import json
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# OpenSSL backed HMAC constructor, its objects copy, update and digest without the pure Python wrapper
+try:
+    from _hashlib import hmac_new as _hmac_new
+except ImportError:
+    _hmac_new = hmac.new
+
+# Mandatory keys of nested data in create payment request
+# optional: phone, vatId
+_CUSTOMER_MANDATORY = frozenset({"firstName", "lastName", "email"})
+# optional: county
+_ADDRESS_MANDATORY = frozenset({"streetAddress", "postalCode", "city", "country"})
+# optional: description, category, stamp, reference, merchant, commission
+_ITEM_MANDATORY = frozenset({"unitPrice", "units", "vatPercentage", "productCode", "deliveryDate"})
+_ITEM_INT_KEYS = ("unitPrice", "units", "vatPercentage")
+_CB_MANDATORY = frozenset({"success", "cancel"})
+
+# Mandatory top level keys of create payment request
+_CREATE_PAYMENT_KEYS = frozenset({'stamp', 'reference', 'amount', 'currency', 'language', 'items', 'customer',
+                                  'deliveryAddress', 'invoicingAddress', 'redirectUrls', 'callbackUrls'})
 
 
 class CheckoutCli(object):
-    _is_test_mode = 0
-    _base_api_end_point = None
-    _merchant_id = None
-    _secret_key = None
-    _algorithm = "sha256"
-    _accepted_api_type = ["Payments", "PaymentDetails", "Refund", "ListProviders"]
+    __slots__ = ('_is_test_mode', '_base_api_end_point', '_merchant_id', '_secret_key', '_secret_bytes',
+                 '_hmac_template', '_session', 'logger')
 
-    logger = None
+    _algorithm = "sha256"
+    _ACCEPTED_API_TYPES = frozenset(("Payments", "PaymentDetails", "Refund", "ListProviders"))
+    # API types which operate on an existing transaction
+    _TRANSACTION_API_TYPES = frozenset(("PaymentDetails", "Refund"))
+    _URL_TEMPLATES = {
+        "Payments": "{base}/payments",
+        "PaymentDetails": "{base}/payments/{tid}",
+        "Refund": "{base}/payments/{tid}/refund",
+        "ListProviders": "{base}/merchants/payment-providers",
+    }
 
     def __init__(self, is_test_mode=0, merchant_id=None, secret_key=None):
 
-        logging.basicConfig(
-            level=logging.DEBUG,
-        )
         self.set_logger()
 
         self._is_test_mode = is_test_mode
@@ -46,17 +71,60 @@ class CheckoutCli(object):
 
             if merchant_id is None:
                 raise KeyError("Missing merchant id")
-            self._merchant_id = merchant_id
+            self._merchant_id = str(merchant_id)
 
             if secret_key is None:
                 raise KeyError("Missing secret key")
 
             self._secret_key = str(secret_key)
 
+        # encode secret key once for every signing call
+        self._secret_bytes = self._secret_key.encode('utf-8')
+        # keyed HMAC state, copied per signature so the key is only processed once
+        self._hmac_template = _hmac_new(self._secret_bytes, b'', 'sha256')
+
+        self._session = self.create_session()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def create_session(self):
+        """
+        Create HTTP session object which keeps connections to Checkout alive between requests.
+
+        :return session: requests.Session object
+        """
+        # Retry only connection errors before the request is sent and 429/503 responses, which mean the
+        # request was refused without processing. Errors after the request was sent (read=0, other=0) and
+        # 502/504, where the payment may have been created, are not retried to avoid duplicate payments.
+        retries = Retry(total=3, connect=3, read=0, other=0, status=3, backoff_factor=0.3,
+                        status_forcelist=(429, 503), allowed_methods=frozenset(['GET', 'POST']),
+                        respect_retry_after_header=True, raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=32, max_retries=retries)
+
+        session = requests.Session()
+        session.mount('https://', adapter)
+
+        return session
+
+    def close(self):
+        """
+        Close HTTP session and release pooled connections.
+
+        :return:
+        """
+        if self._session is not None:
+            self._session.close()
+
     def set_logger(self):
         """
         Set logger object.
 
+        Logging is not configured by this module, callers set up handlers and levels themselves.
+
         :return:
         """
         self.logger = logging.getLogger(__name__)
@@ -75,47 +143,76 @@ class CheckoutCli(object):
         return
 
     def get_post_url(self, api_type="Payments", transaction_id=None):
-        post_url = None
-        if api_type == "Payments":
-            post_url = self._base_api_end_point + '/payments'
-        elif api_type == "PaymentDetails":
-            self.validate_trans_id_data(transaction_id=transaction_id)
-            post_url = self._base_api_end_point + '/payments/' + transaction_id
-        elif api_type == "Refund":
+        url_template = self._URL_TEMPLATES.get(api_type)
+        if url_template is None:
+            return None
+
+        if api_type in self._TRANSACTION_API_TYPES:
             self.validate_trans_id_data(transaction_id=transaction_id)
-            post_url = self._base_api_end_point + '/payments/' + transaction_id + '/refund'
-        elif api_type == "ListProviders":
-            post_url = self._base_api_end_point + '/merchants/payment-providers'
 
-        return post_url
+        return url_template.format(base=self._base_api_end_point, tid=transaction_id or "")
+
+    def get_time_stamp_string(self):
+        """
+        Get current UTC time in ISO 8601 format for checkout-timestamp header.
+
+        :return time_stamp_string: timestamp string, e.g. 2018-07-06T10:01:31.904Z
+        """
+        return datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.000Z')
 
     def get_req_header_dict(self, api_type="Payment", method="POST", request_id=None, trans_id=None, \
                             time_stamp_string=None):
 
-        if api_type not in self._accepted_api_type:
+        if api_type not in self._ACCEPTED_API_TYPES:
             raise ValueError("Invalid value in api_type parameter")
 
-        if api_type == "PaymentDetails" or api_type == "Refund":
+        if api_type in self._TRANSACTION_API_TYPES:
             if trans_id is None:
                 raise KeyError("Missing data to trans_id parameter")
 
         if time_stamp_string is None:
-            #TODO: must include timezone
-            time_stamp = datetime.now().strftime('%Y-%m-%dT%H%M%S')
+            time_stamp_string = self.get_time_stamp_string()
 
+        # header values are signed as text, so all of them are str
         header_dict = {
             'checkout-account': self._merchant_id,
             'checkout-algorithm': self._algorithm,
             'checkout-method': method,
-            'checkout-nonce': request_id,
-            'checkout-timestamp': time_stamp,
+            'checkout-nonce': str(request_id),
+            'checkout-timestamp': time_stamp_string,
         }
 
-        if api_type == "PaymentDetails" or api_type == "Refund":
-            header_dict["checkout-transaction-id"] = trans_id
+        if api_type in self._TRANSACTION_API_TYPES:
+            header_dict["checkout-transaction-id"] = str(trans_id)
 
         return header_dict
 
+    def finalize_headers(self, headers=None, signature=None):
+        """
+        Build request header parameters with HMAC signature and common settings.
+
+        :param headers: dictionary of checkout header data which was signed
+        :param signature: HMAC signature of headers
+        :return headers_dict: new dictionary of request header data
+        """
+        return {
+            **headers,
+            'signature': signature,
+            'Content-Type': 'application/json; charset=utf-8',
+            'Accept': 'application/json',
+        }
+
+    def serialize_json_body(self, data=None):
+        """
+        Serialize request data to compact JSON bytes.
+
+        The same bytes are signed and sent, so the output must not depend on installed packages.
+
+        :param data: request data
+        :return body_bytes: UTF-8 encoded JSON
+        """
+        return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
     def get_hash_sha256(self, **kwargs):
         """
         Calculate SHA256 digest string.
@@ -126,53 +223,49 @@ class CheckoutCli(object):
         if kwargs is None or len(kwargs) == 0:
             raise KeyError("Expect input parameters")
 
-        secret_key = str(self._secret_key)
-        self.logger.debug("Secret key: {}".format(secret_key))
-
-        # - need to sort key alphabetically
-        header_dict = sorted(kwargs["headers"])
+        headers = kwargs["headers"]
 
         # some API will have body content
         body = kwargs.get("body", None)
 
-        items = []
-        for key in sorted(header_dict):
-            self.logger.debug("Key={}, Value={}".format(key, header_dict[key]))
-            # concate data to following format: key + ':' + value of headers dictionary
-            temp_string = key + ':' + header_dict[key]
-            items.append(str(temp_string))
+        is_debug = self.logger.isEnabledFor(logging.DEBUG)
 
-        if body is not None:
-            items.append(body)
+        # - need to sort key alphabetically
+        keys = sorted(headers)
 
-        plain_text = "\n".join(map(str, items))
-        if body is None:
-            plain_text += "\n"
-        self.logger.debug("Plain text={}".format(plain_text))
+        if is_debug:
+            for key in keys:
+                self.logger.debug("Key=%s, Value=%s", key, headers[key])
 
-        if sys.version_info < (3, 0):
-            # plain_text.decode('utf-8')
-            message_bytes = bytes(plain_text)
-            secret_bytes = bytes(secret_key)
-        else:
-            message_bytes = bytes(plain_text, 'utf-8')
-            secret_bytes = bytes(secret_key, 'utf-8')
+        # concate data to following format: key + ':' + value of headers dictionary,
+        # every header line ends with '\n' and body content (if any) follows the last one
+        message_bytes = "".join([f"{key}:{headers[key]}\n" for key in keys]).encode('utf-8')
 
-        hash_string = hmac.new(secret_bytes, message_bytes, hashlib.sha256)
+        if body is not None:
+            message_bytes += body if isinstance(body, bytes) else body.encode('utf-8')
+
+        if is_debug:
+            self.logger.debug("Plain text=%s", message_bytes)
+
+        hash_string = self._hmac_template.copy()
+        hash_string.update(message_bytes)
 
         # to lowercase hexits
         digest_string = hash_string.hexdigest()
-        self.logger.debug("Digest string={}".format(digest_string))
+        if is_debug:
+            self.logger.debug("Digest string=%s", digest_string)
 
-        return str(digest_string)
+        return digest_string
 
-    def send_request(self, send_method='POST', _api_post_url=None, req_input=None, **headers):
+    def send_request(self, send_method='POST', _api_post_url=None, req_input=None, json_body=None, **headers):
         """
         Send a request to Checkout.
 
         :param send_method: type of request method. Possible value are 'POST' and 'GET', 'POST' is default value.
         :param _api_post_url: string of post URL
         :param req_input: request input data
+        :param json_body: request data to send as JSON body, either serialized bytes or data for
+                          serialize_json_body
         :param headers: dictionary of header data
         :return res_obj: response object
         """
@@ -186,81 +279,88 @@ class CheckoutCli(object):
             }
 
         if send_method == 'POST':
-            if req_input is None:
-                res_obj = requests.post(_api_post_url, headers=headers)
+            if json_body is not None:
+                if not isinstance(json_body, bytes):
+                    json_body = self.serialize_json_body(data=json_body)
+                headers.setdefault('Content-Type', 'application/json; charset=utf-8')
+                res_obj = self._session.post(_api_post_url, data=json_body, headers=headers)
+            elif req_input is None:
+                res_obj = self._session.post(_api_post_url, headers=headers)
             else:
-                res_obj = requests.post(_api_post_url, data=req_input, headers=headers)
+                res_obj = self._session.post(_api_post_url, data=req_input, headers=headers)
 
         else:
             if req_input is None:
-                res_obj = requests.get(_api_post_url, headers=headers)
+                res_obj = self._session.get(_api_post_url, headers=headers)
             else:
-                res_obj = requests.get(_api_post_url, headers=headers, data=req_input, params=req_input)
+                res_obj = self._session.get(_api_post_url, headers=headers, data=req_input, params=req_input)
 
-        # self.logger.debug("Request headers={}".format(res_obj.request.headers))
+        # self.logger.debug("Request headers=%s", res_obj.request.headers)
 
+        return self.validate_response(res_obj)
+
+    def validate_response(self, res_obj=None):
+        """
+        Check status code of response from Checkout.
+
+        :param res_obj: response object
+        :return res_obj: response object
+        """
         # Response data object is in 'res_obj' variable
         res_status_code = res_obj.status_code
-        self.logger.debug("Response status code={}".format(res_status_code))
-        # self.logger.debug("Response content={}".format(res_obj.content))
+        self.logger.debug("Response status code=%s", res_status_code)
+        # self.logger.debug("Response content=%s", res_obj.content)
 
         if res_status_code != 200 and res_status_code != 201:
             error_text = res_obj.content
-            self.logger.error("Unexpected response text={}".format(error_text))
+            self.logger.error("Unexpected response text=%s", error_text)
             raise Exception(error_text)
 
         return res_obj
 
     def get_create_payment_keys(self):
-        data = ['stamp', 'reference', 'amount', 'currency', 'language', 'items', 'customer', 'deliveryAddress',\
-                'invoicingAddress', 'redirectUrls', 'callbackUrls']
-        return data
+        return _CREATE_PAYMENT_KEYS
 
     def validate_create_payment_input(self, **kwargs):
         if kwargs is None or len(kwargs) == 0:
             raise KeyError("Expect input parameters")
 
-        keyList = self.get_create_payment_keys()
-        for key in keyList:
-            value = kwargs.get(key, None)
-            if value is None:
-                error_msg = "Missing " + key + " parameter"
-                raise ValueError(error_msg)
+        missing = _CREATE_PAYMENT_KEYS - kwargs.keys()
+        if missing:
+            raise ValueError(f"Missing parameters: {sorted(missing)}")
+
+        for key in _CREATE_PAYMENT_KEYS:
+            if kwargs[key] is None:
+                raise ValueError(f"Missing {key} parameter")
 
         return
 
-    def validate_data_dict(self, key_dict=None, data_dict=None):
-        if key_dict is None:
-            raise KeyError("Missing key mapping data in key_dict parameter")
+    def validate_data_dict(self, mandatory_keys=None, data_dict=None):
+        if mandatory_keys is None:
+            raise KeyError("Missing mandatory key set in mandatory_keys parameter")
 
         if data_dict is None:
             raise KeyError("Missing value in data_dict parameter")
 
-        for key in key_dict:
-            if key_dict[key] is True:
-                if key not in data_dict:
-                    error_msg = "Missing mandatory key: " + key
-                    raise KeyError(error_msg)
+        if not isinstance(data_dict, dict):
+            raise ValueError("Expect dictionary data type for data_dict parameter")
+
+        missing = mandatory_keys - data_dict.keys()
+        if missing:
+            error_msg = "Missing mandatory key: " + ", ".join(sorted(missing))
+            raise KeyError(error_msg)
 
-                value = data_dict[key]
-                if value is None:
-                    error_msg = "Invalid value in " + key + " parameter"
-                    raise KeyError(error_msg)
+        if not all(data_dict[key] is not None for key in mandatory_keys):
+            invalid = sorted(key for key in mandatory_keys if data_dict[key] is None)
+            error_msg = "Invalid value in " + ", ".join(invalid) + " parameter"
+            raise KeyError(error_msg)
         return
 
     def validate_customer_key_value_in_create_payment(self, customer_dict=None):
         if customer_dict is None:
             raise KeyError("Missing customer_dict parameter")
 
-        keySet = {
-            "firstName": True,
-            "lastName": True,
-            "email": True,
-            "phone": False,
-            "vatId": False
-        }
-
-        self.validate_data_dict(key_dict=keySet, data_dict=customer_dict)
+        self.validate_data_dict(mandatory_keys=_CUSTOMER_MANDATORY, data_dict=customer_dict)
 
         return
 
@@ -268,7 +368,7 @@ class CheckoutCli(object):
         if language_code is None:
             raise KeyError("Missing language_code parameter")
 
-        if not isinstance(language_code, six.string_types):
+        if not isinstance(language_code, str):
             raise ValueError("Expect string data type for language parameter")
 
         code_length = len(language_code)
@@ -285,18 +385,10 @@ class CheckoutCli(object):
         if data_dict is None:
             raise KeyError("Missing data_dict parameter")
 
-        keySet = {
-            "streetAddress": True,
-            "postalCode": True,
-            "city": True,
-            "county": False,
-            "country": True
-        }
-
-        self.validate_data_dict(key_dict=keySet, data_dict=data_dict)
+        self.validate_data_dict(mandatory_keys=_ADDRESS_MANDATORY, data_dict=data_dict)
 
         # Validate country code
-        if not isinstance(value, six.string_types):
+        if not isinstance(data_dict["country"], str):
             raise ValueError("Expect string data type for country parameter")
 
         country_code_length = len(data_dict["country"])
@@ -304,42 +396,33 @@ class CheckoutCli(object):
             raise ValueError("Invalid country code value length. Expected 2 letters of country code")
 
         # Convert to upper case
-        data_dict["country"].upper()
+        data_dict["country"] = data_dict["country"].upper()
 
         return
 
     def validate_int_value(self, key=None, value=None):
 
-        if not isinstance(value, int):
+        # bool is a subclass of int, so compare the exact type
+        if type(value) is not int:
             error_msg = "Expect int value in " + key + " parameter"
             raise ValueError(error_msg)
         return
 
-    def validate_item_data_in_create_payment(self, data_dict=None):
-        if data_dict is None:
-            raise KeyError("Missing data_dict parameter")
+    def validate_item_data_in_create_payment(self, items=None):
+        if items is None:
+            raise KeyError("Missing items parameter")
 
-        keySet = {
-            "unitPrice": True,
-            "units": True,
-            "vatPercentage": True,
-            "productCode": True,
-            "deliveryDate": True,
-            "description": False,
-            "category": False,
-            "stamp": False,
-            "reference": False,
-            "merchant": False,
-            "commission": False
-        }
-
-        self.validate_data_dict(key_dict=keySet, data_dict=data_dict)
+        if not isinstance(items, list) or len(items) == 0:
+            raise ValueError("Expect non-empty list of items in items parameter")
 
-        self.validate_int_value(key="unitPrice", value=data_dict["unitPrice"])
+        for item in items:
+            if not isinstance(item, dict):
+                raise ValueError("Expect dictionary data type for each item in items parameter")
 
-        self.validate_int_value(key="units", value=data_dict["units"])
+            self.validate_data_dict(mandatory_keys=_ITEM_MANDATORY, data_dict=item)
 
-        self.validate_int_value(key="vatPercentage", value=data_dict["vatPercentage"])
+            for key in _ITEM_INT_KEYS:
+                self.validate_int_value(key=key, value=item[key])
 
         return
 
@@ -347,12 +430,7 @@ class CheckoutCli(object):
         if data_dict is None:
             raise KeyError("Missing data_dict parameter")
 
-        keySet = {
-            "success": True,
-            "cancel": True
-        }
-
-        self.validate_data_dict(key_dict=keySet, data_dict=data_dict)
+        self.validate_data_dict(mandatory_keys=_CB_MANDATORY, data_dict=data_dict)
 
         # TODO: check that data starts with "https://"
 
@@ -395,14 +473,14 @@ class CheckoutCli(object):
                 "postalCode": "00100",
                 "city": "Luleå",
                 "county": "Norrbotten",
-                "country": "Sweden"
+                "country": "SE"
             },
             "invoicingAddress": {
                 "streetAddress": "Fake street 123",
                 "postalCode": "00100",
                 "city": "Luleå",
                 "county": "Norrbotten",
-                "country": "Sweden"
+                "country": "SE"
             },
             "redirectUrls": {
                 "success": "https://ecom.example.org/success",
@@ -415,7 +493,16 @@ class CheckoutCli(object):
         }
         return data
 
-    def create_payment(self, request_id=None, input_data_dict=None, time_stamp_string=None):
+    def prepare_create_payment(self, request_id=None, input_data_dict=None, time_stamp_string=None):
+        """
+        Validate payment input and build signed request data without sending anything.
+
+        :param request_id: unique request id
+        :param input_data_dict: dictionary of payment data
+        :param time_stamp_string: timestamp string of request
+        :return (post_url, headers_dict, body_bytes): tuple of data for send_request, body_bytes is
+                                                      the serialized payment data which was signed
+        """
         if request_id is None:
             raise KeyError("Missing unique request id value in request_id parameter")
 
@@ -448,7 +535,7 @@ class CheckoutCli(object):
 
         self.validate_address_value_in_create_payment(data_dict=input_data_dict["deliveryAddress"])
 
-        self.validate_item_data_in_create_payment(data_dict=input_data_dict["items"])
+        self.validate_item_data_in_create_payment(items=input_data_dict["items"])
 
         self.validate_callback_urls_data(data_dict=input_data_dict["redirectUrls"])
 
@@ -460,18 +547,78 @@ class CheckoutCli(object):
         headers_dict = self.get_req_header_dict(api_type="Payments", method="POST", request_id=request_id,\
                                                 time_stamp_string=time_stamp_string)
 
+        # Serialize body once, the signature covers exactly the bytes which are sent
+        body_bytes = self.serialize_json_body(data=input_data_dict)
+
         # Calculate HMAC
-        hmac_dict = { "headers": headers_dict, "body": None }
-        signature = self.get_hash_sha256(**hmac_dict)
+        signature = self.get_hash_sha256(headers=headers_dict, body=body_bytes)
 
-        # Add HMAC to request header parameters
-        headers_dict["signature"] = signature
+        return post_url, self.finalize_headers(headers=headers_dict, signature=signature), body_bytes
 
-        # set common settings in request header parameters
-        headers_dict["Content-Type"] = 'application/json; charset=utf-8'
-        headers_dict["Accept"] = 'application/json'
+    def create_payment(self, request_id=None, input_data_dict=None, time_stamp_string=None):
+        post_url, headers_dict, body_bytes = self.prepare_create_payment(request_id=request_id,\
+                                                                         input_data_dict=input_data_dict,\
+                                                                         time_stamp_string=time_stamp_string)
 
         # Do send a call
-        res_obj = self.send_request(send_method="POST", _api_post_url=post_url, req_input=input_data_dict)
+        res_obj = self.send_request(send_method="POST", _api_post_url=post_url, json_body=body_bytes, **headers_dict)
+
+        return res_obj
+
+    def create_payments_bulk(self, items=None, max_workers=16):
+        """
+        Create many payments concurrently over the pooled HTTP session.
+
+        All items are validated and signed before any request is sent. A failed request does not stop
+        the others, its exception is returned in place of the response so callers can tell which
+        payments were created.
+
+        :param items: list of dictionaries with create_payment parameters
+                      (request_id, input_data_dict and optional time_stamp_string)
+        :param max_workers: maximum number of concurrent requests
+        :return res_obj_list: list of response objects or exceptions in the same order as items
+        """
+        if items is None or len(items) == 0:
+            raise KeyError("Expect list of payment data in items parameter")
+
+        prepared_list = [self.prepare_create_payment(**item) for item in items]
+
+        res_obj_list = [None] * len(prepared_list)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            future_dict = {}
+            for index, (post_url, headers_dict, body_bytes) in enumerate(prepared_list):
+                future = executor.submit(self.send_request, send_method="POST", _api_post_url=post_url,\
+                                         json_body=body_bytes, **headers_dict)
+                future_dict[future] = index
+
+            for future in as_completed(future_dict):
+                error = future.exception()
+                res_obj_list[future_dict[future]] = future.result() if error is None else error
+
+        return res_obj_list
+
+    def prepare_list_providers(self, request_id=None):
+        """
+        Build signed request data for listing payment providers.
+
+        The request has no body and no transaction id, so no input validation is needed.
+
+        :param request_id: unique request id
+        :return (post_url, headers_dict): tuple of data for send_request
+        """
+        if request_id is None:
+            raise KeyError("Missing unique request id value in request_id parameter")
+
+        post_url = self.get_post_url(api_type="ListProviders")
+
+        headers_dict = self.get_req_header_dict(api_type="ListProviders", method="GET", request_id=request_id)
+        signature = self.get_hash_sha256(headers=headers_dict)
+
+        return post_url, self.finalize_headers(headers=headers_dict, signature=signature)
+
+    def list_providers(self, request_id=None):
+        post_url, headers_dict = self.prepare_list_providers(request_id=request_id)
+
+        res_obj = self.send_request(send_method="GET", _api_post_url=post_url, **headers_dict)
 
         return res_obj
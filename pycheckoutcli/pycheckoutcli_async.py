@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+
+"""
+Asynchronous client module to communicate with Checkout PSP API with normal payment
+
+Requires httpx with HTTP/2 support (pip install "pycheckoutcli[async]").
+
+Checkout Finland PSP API specification
+https://checkoutfinland.github.io/psp-api/#/
+
+"""
+
+import asyncio
+
+import httpx
+
+from .pycheckoutcli import CheckoutCli
+
+
+class AsyncCheckoutCli(CheckoutCli):
+    __slots__ = ('_client',)
+
+    def __init__(self, is_test_mode=0, merchant_id=None, secret_key=None):
+        super(AsyncCheckoutCli, self).__init__(is_test_mode=is_test_mode, merchant_id=merchant_id,
+                                               secret_key=secret_key)
+
+        # HTTP/2 multiplexes concurrent requests over shared connections
+        self._client = httpx.AsyncClient(http2=True,
+                                         limits=httpx.Limits(max_connections=100, max_keepalive_connections=20))
+
+    def __enter__(self):
+        raise TypeError("Use 'async with' to manage AsyncCheckoutCli")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    def create_session(self):
+        """
+        Requests are sent through httpx.AsyncClient, so no requests.Session is created.
+
+        :return:
+        """
+        return None
+
+    def close(self):
+        """
+        Not supported, the HTTP client must be closed with aclose().
+
+        :return:
+        """
+        raise TypeError("Use 'await aclose()' to close AsyncCheckoutCli")
+
+    async def aclose(self):
+        """
+        Close HTTP client and release its connections.
+
+        :return:
+        """
+        await self._client.aclose()
+
+    async def send_request(self, send_method='POST', _api_post_url=None, req_input=None, json_body=None, **headers):
+        """
+        Send a request to Checkout.
+
+        :param send_method: type of request method. Possible value are 'POST' and 'GET', 'POST' is default value.
+        :param _api_post_url: string of post URL
+        :param req_input: request input data
+        :param json_body: request data to send as JSON body, either serialized bytes or data for
+                          serialize_json_body
+        :param headers: dictionary of header data
+        :return res_obj: response object
+        """
+        if _api_post_url is None or _api_post_url == '':
+            raise ValueError("Need post URL data")
+
+        if send_method == 'POST':
+            if json_body is not None:
+                if not isinstance(json_body, bytes):
+                    json_body = self.serialize_json_body(data=json_body)
+                headers.setdefault('Content-Type', 'application/json; charset=utf-8')
+                res_obj = await self._client.post(_api_post_url, content=json_body, headers=headers)
+            elif req_input is None:
+                res_obj = await self._client.post(_api_post_url, headers=headers)
+            else:
+                res_obj = await self._client.post(_api_post_url, data=req_input, headers=headers)
+
+        else:
+            if req_input is None:
+                res_obj = await self._client.get(_api_post_url, headers=headers)
+            else:
+                res_obj = await self._client.get(_api_post_url, headers=headers, params=req_input)
+
+        return self.validate_response(res_obj)
+
+    async def create_payment(self, request_id=None, input_data_dict=None, time_stamp_string=None):
+        post_url, headers_dict, body_bytes = self.prepare_create_payment(request_id=request_id,\
+                                                                         input_data_dict=input_data_dict,\
+                                                                         time_stamp_string=time_stamp_string)
+
+        # Do send a call
+        res_obj = await self.send_request(send_method="POST", _api_post_url=post_url, json_body=body_bytes,\
+                                          **headers_dict)
+
+        return res_obj
+
+    async def list_providers(self, request_id=None):
+        post_url, headers_dict = self.prepare_list_providers(request_id=request_id)
+
+        res_obj = await self.send_request(send_method="GET", _api_post_url=post_url, **headers_dict)
+
+        return res_obj
+
+    async def create_payments_bulk(self, items=None, max_workers=16):
+        """
+        Create many payments concurrently over the shared HTTP/2 client.
+
+        All items are validated and signed before any request is sent. A failed request does not stop
+        the others, its exception is returned in place of the response so callers can tell which
+        payments were created.
+
+        :param items: list of dictionaries with create_payment parameters
+                      (request_id, input_data_dict and optional time_stamp_string)
+        :param max_workers: maximum number of concurrent requests
+        :return res_obj_list: list of response objects or exceptions in the same order as items
+        """
+        if items is None or len(items) == 0:
+            raise KeyError("Expect list of payment data in items parameter")
+
+        prepared_list = [self.prepare_create_payment(**item) for item in items]
+
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def send_payment(post_url, headers_dict, body_bytes):
+            async with semaphore:
+                return await self.send_request(send_method="POST", _api_post_url=post_url, json_body=body_bytes,
+                                               **headers_dict)
+
+        res_obj_list = await asyncio.gather(*(
+            send_payment(post_url, headers_dict, body_bytes)
+            for post_url, headers_dict, body_bytes in prepared_list
+        ), return_exceptions=True)
+
+        return list(res_obj_list)
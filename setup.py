@@ -12,7 +12,9 @@ with open('HISTORY.rst') as history_file:
     history = history_file.read()
 
 requirements = [
-    # TODO: put package requirements here
+    'requests>=2.25',
+    # Retry(allowed_methods=..., other=...) is available from urllib3 1.26
+    'urllib3>=1.26',
 ]
 
 setup_requirements = [
@@ -23,6 +25,10 @@ test_requirements = [
     # TODO: put package test requirements here
 ]
 
+extras_requirements = {
+    'async': ['httpx[http2]'],
+}
+
 setup(
     name='pycheckoutcli',
     version='0.1.0',
@@ -34,6 +40,8 @@ setup(
     packages=find_packages(include=['pycheckoutcli']),
     include_package_data=True,
     install_requires=requirements,
+    python_requires='>=3.6',
+    extras_require=extras_requirements,
     license="MIT license",
     zip_safe=False,
     keywords='pycheckoutcli',
@@ -42,13 +50,14 @@ setup(
         'Intended Audience :: Developers',
         'License :: OSI Approved :: MIT License',
         'Natural Language :: English',
-        "Programming Language :: Python :: 2",
-        'Programming Language :: Python :: 2.6',
-        'Programming Language :: Python :: 2.7',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.3',
-        'Programming Language :: Python :: 3.4',
-        'Programming Language :: Python :: 3.5',
+        'Programming Language :: Python :: 3 :: Only',
+        'Programming Language :: Python :: 3.6',
+        'Programming Language :: Python :: 3.7',
+        'Programming Language :: Python :: 3.8',
+        'Programming Language :: Python :: 3.9',
+        'Programming Language :: Python :: 3.10',
+        'Programming Language :: Python :: 3.11',
     ],
     test_suite='tests',
     tests_require=test_requirements,
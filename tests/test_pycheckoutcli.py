@@ -4,19 +4,317 @@
 """Tests for `pycheckoutcli` package."""
 
 
+import asyncio
+import json
 import unittest
 
+try:
+    import httpx
+    from pycheckoutcli import pycheckoutcli_async
+except ImportError:
+    httpx = None
+    pycheckoutcli_async = None
+
 from pycheckoutcli import pycheckoutcli
 
 
+# HMAC calculation example from Checkout PSP API specification
+SPEC_HEADERS = {
+    'checkout-account': '375917',
+    'checkout-algorithm': 'sha256',
+    'checkout-method': 'POST',
+    'checkout-nonce': '564635208570151',
+    'checkout-timestamp': '2018-07-06T10:01:31.904Z',
+}
+SPEC_BODY = '{"stamp":"unique-identifier-for-merchant","reference":"3759170","amount":1525,"currency":"EUR",' \
+            '"language":"FI","items":[{"unitPrice":1525,"units":1,"vatPercentage":24,"productCode":"#1234",' \
+            '"deliveryDate":"2018-09-01"}],"customer":{"email":"test.customer@example.com"},' \
+            '"redirectUrls":{"success":"https://ecom.example.com/cart/success",' \
+            '"cancel":"https://ecom.example.com/cart/cancel"}}'
+SPEC_SIGNATURE = '3708f6497ae7cc55a2e6009fc90aa10c3ad0ef125260ee91b19168750f6d74f6'
+
+
+class FakeResponse(object):
+    """Response stub with status code and request data."""
+
+    def __init__(self, status_code=201, url=None, headers=None, data=None):
+        self.status_code = status_code
+        self.content = b''
+        self.url = url
+        self.headers = headers
+        self.data = data
+
+
+class FakeSession(object):
+    """requests.Session stub which records sent requests instead of sending them."""
+
+    def __init__(self):
+        self.sent = []
+        # checkout-nonce values which get error response
+        self.failing_nonces = set()
+
+    def post(self, url, data=None, headers=None):
+        self.sent.append((url, headers, data))
+        status_code = 400 if headers.get('checkout-nonce') in self.failing_nonces else 201
+        return FakeResponse(status_code=status_code, url=url, headers=headers, data=data)
+
+    def get(self, url, headers=None):
+        self.sent.append((url, headers, None))
+        return FakeResponse(status_code=200, url=url, headers=headers)
+
+    def close(self):
+        pass
+
+
 class TestPycheckoutcli(unittest.TestCase):
     """Tests for `pycheckoutcli` package."""
 
     def setUp(self):
         """Set up test fixtures, if any."""
+        self.cli = pycheckoutcli.CheckoutCli(is_test_mode=1)
+        self.cli.close()
+        self.cli._session = FakeSession()
 
     def tearDown(self):
         """Tear down test fixtures, if any."""
+        self.cli.close()
 
     def test_000_something(self):
         """Test something."""
+
+    def test_001_hash_sha256_spec_example(self):
+        """Test HMAC of headers and body against specification example."""
+        self.assertEqual(self.cli.get_hash_sha256(headers=SPEC_HEADERS, body=SPEC_BODY), SPEC_SIGNATURE)
+        self.assertEqual(self.cli.get_hash_sha256(headers=SPEC_HEADERS, body=SPEC_BODY.encode('utf-8')),
+                         SPEC_SIGNATURE)
+
+    def test_002_serialize_json_body(self):
+        """Test JSON body is serialized in compact form as in specification example."""
+        self.assertEqual(self.cli.serialize_json_body(data=json.loads(SPEC_BODY)), SPEC_BODY.encode('utf-8'))
+
+    def assert_signed_request(self, url, headers, data):
+        signed_headers = {key: value for key, value in headers.items() if key.startswith('checkout-')}
+        self.assertEqual(url, 'https://api.checkout.fi/payments')
+        self.assertEqual(headers['signature'], self.cli.get_hash_sha256(headers=signed_headers, body=data))
+
+    def test_003_create_payment_signs_sent_body(self):
+        """Test create payment signature covers headers and the sent body."""
+        res_obj = self.cli.create_payment(request_id='1', time_stamp_string='2018-07-06T10:01:31.904Z')
+
+        self.assert_signed_request(res_obj.url, res_obj.headers, res_obj.data)
+        self.assertEqual(json.loads(res_obj.data)["amount"], 1590)
+
+    def test_004_create_payments_bulk(self):
+        """Test bulk payments are signed and returned in input order."""
+        items = [{"request_id": str(request_id)} for request_id in range(5)]
+        res_obj_list = self.cli.create_payments_bulk(items=items, max_workers=3)
+
+        self.assertEqual([res_obj.headers['checkout-nonce'] for res_obj in res_obj_list], ['0', '1', '2', '3', '4'])
+        for res_obj in res_obj_list:
+            self.assert_signed_request(res_obj.url, res_obj.headers, res_obj.data)
+
+        with self.assertRaises(KeyError):
+            self.cli.create_payments_bulk(items=[])
+
+    def test_004_create_payments_bulk_partial_failure(self):
+        """Test failed bulk payment is returned as exception in its slot and others are kept."""
+        self.cli._session.failing_nonces = {'2'}
+        items = [{"request_id": str(request_id)} for request_id in range(5)]
+        res_obj_list = self.cli.create_payments_bulk(items=items, max_workers=3)
+
+        self.assertEqual(len(self.cli._session.sent), 5)
+        self.assertIsInstance(res_obj_list[2], Exception)
+        for index in (0, 1, 3, 4):
+            self.assertEqual(res_obj_list[index].status_code, 201)
+            self.assertEqual(res_obj_list[index].headers['checkout-nonce'], str(index))
+
+    def test_005_validate_item_data(self):
+        """Test items are validated as a list of item dictionaries."""
+        items = self.cli.get_test_req_create_payment_data()["items"]
+        self.cli.validate_item_data_in_create_payment(items=items)
+
+        for invalid_items in ([], {}, items[0], [1]):
+            with self.assertRaises(ValueError):
+                self.cli.validate_item_data_in_create_payment(items=invalid_items)
+
+        with self.assertRaises(KeyError):
+            self.cli.validate_item_data_in_create_payment(items=None)
+
+        item = dict(items[0])
+        del item["productCode"]
+        with self.assertRaisesRegex(KeyError, "Missing mandatory key: productCode"):
+            self.cli.validate_item_data_in_create_payment(items=[item])
+
+        item = dict(items[0], units="1")
+        with self.assertRaisesRegex(ValueError, "Expect int value in units parameter"):
+            self.cli.validate_item_data_in_create_payment(items=[item])
+
+        item = dict(items[0], unitPrice=True)
+        with self.assertRaisesRegex(ValueError, "Expect int value in unitPrice parameter"):
+            self.cli.validate_item_data_in_create_payment(items=[item])
+
+    def test_006_validate_address_country(self):
+        """Test country code of address is validated and converted to upper case."""
+        address = dict(self.cli.get_test_req_create_payment_data()["deliveryAddress"], country="fi")
+        self.cli.validate_address_value_in_create_payment(data_dict=address)
+        self.assertEqual(address["country"], "FI")
+
+        with self.assertRaises(ValueError):
+            self.cli.validate_address_value_in_create_payment(data_dict=dict(address, country="Finland"))
+
+        with self.assertRaises(ValueError):
+            self.cli.validate_address_value_in_create_payment(data_dict=dict(address, country=246))
+
+    def test_007_req_header_dict_time_stamp(self):
+        """Test given timestamp is used as is and generated one is UTC ISO 8601."""
+        header_dict = self.cli.get_req_header_dict(api_type="Payments", request_id=1,
+                                                   time_stamp_string="2018-07-06T10:01:31.904Z")
+        self.assertEqual(header_dict["checkout-timestamp"], "2018-07-06T10:01:31.904Z")
+        self.assertEqual(header_dict["checkout-nonce"], "1")
+
+        header_dict = self.cli.get_req_header_dict(api_type="Payments", request_id=1)
+        self.assertRegex(header_dict["checkout-timestamp"], r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.000Z$")
+
+    def test_008_validate_create_payment_input(self):
+        """Test all missing create payment keys are reported at once."""
+        data = self.cli.get_test_req_create_payment_data()
+        self.cli.validate_create_payment_input(**data)
+
+        del data["stamp"]
+        del data["items"]
+        with self.assertRaisesRegex(ValueError, r"Missing parameters: \['items', 'stamp'\]"):
+            self.cli.validate_create_payment_input(**data)
+
+        data = dict(self.cli.get_test_req_create_payment_data(), amount=None)
+        with self.assertRaisesRegex(ValueError, "Missing amount parameter"):
+            self.cli.validate_create_payment_input(**data)
+
+    def test_009_validate_data_dict(self):
+        """Test missing and None mandatory values are all reported."""
+        self.cli.validate_callback_urls_data(data_dict={"success": "https://a", "cancel": "https://b"})
+
+        with self.assertRaisesRegex(KeyError, "Missing mandatory key: cancel, success"):
+            self.cli.validate_callback_urls_data(data_dict={})
+
+        with self.assertRaisesRegex(KeyError, "Invalid value in cancel parameter"):
+            self.cli.validate_callback_urls_data(data_dict={"success": "https://a", "cancel": None})
+
+        with self.assertRaises(ValueError):
+            self.cli.validate_callback_urls_data(data_dict=["https://a", "https://b"])
+
+        data = dict(self.cli.get_test_req_create_payment_data(), invoicingAddress="Fake street")
+        with self.assertRaises(ValueError):
+            self.cli.prepare_create_payment(request_id='1', input_data_dict=data)
+
+    def test_009_session_retry_policy(self):
+        """Test session retries only requests which were not processed by Checkout."""
+        with pycheckoutcli.CheckoutCli(is_test_mode=1) as cli:
+            retries = cli._session.get_adapter('https://api.checkout.fi').max_retries
+
+        self.assertEqual(retries.read, 0)
+        self.assertEqual(retries.other, 0)
+        self.assertEqual(retries.connect, 3)
+        self.assertEqual(set(retries.allowed_methods), {'GET', 'POST'})
+        self.assertEqual(set(retries.status_forcelist), {429, 503})
+        self.assertFalse(retries.raise_on_status)
+
+    def test_010_list_providers(self):
+        """Test list providers request is a signed GET without body."""
+        res_obj = self.cli.list_providers(request_id=7)
+
+        self.assertEqual(res_obj.url, 'https://api.checkout.fi/merchants/payment-providers')
+        self.assertEqual(res_obj.headers['checkout-method'], 'GET')
+        self.assertEqual(res_obj.headers['checkout-nonce'], '7')
+        self.assertNotIn('checkout-transaction-id', res_obj.headers)
+
+        signed_headers = {key: value for key, value in res_obj.headers.items() if key.startswith('checkout-')}
+        self.assertEqual(res_obj.headers['signature'], self.cli.get_hash_sha256(headers=signed_headers))
+
+        with self.assertRaises(KeyError):
+            self.cli.list_providers()
+
+    @unittest.skipIf(pycheckoutcli_async is None, "httpx is not installed")
+    def test_011_async_cli_requires_async_close(self):
+        """Test async client refuses synchronous context manager and close."""
+        async def run():
+            async with pycheckoutcli_async.AsyncCheckoutCli(is_test_mode=1) as async_cli:
+                with self.assertRaises(TypeError):
+                    with async_cli:
+                        pass
+                with self.assertRaises(TypeError):
+                    async_cli.close()
+            self.assertTrue(async_cli._client.is_closed)
+
+        asyncio.run(run())
+
+    def run_async_cli(self, test_func):
+        """Run test_func with async client which sends requests to mock transport and return sent requests."""
+        sent = []
+
+        def handler(request):
+            sent.append(request)
+            status_code = 400 if request.headers.get('checkout-nonce') == 'fail' else 201
+            return httpx.Response(status_code, content=b'')
+
+        async def run():
+            async with pycheckoutcli_async.AsyncCheckoutCli(is_test_mode=1) as async_cli:
+                await async_cli._client.aclose()
+                async_cli._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+                return await test_func(async_cli)
+
+        return asyncio.run(run()), sent
+
+    @unittest.skipIf(pycheckoutcli_async is None, "httpx is not installed")
+    def test_012_async_create_payments_bulk_partial_failure(self):
+        """Test failed async bulk payment is returned as exception in its slot and others are kept."""
+        items = [{"request_id": request_id} for request_id in ('0', '1', 'fail', '3')]
+        res_obj_list, sent = self.run_async_cli(
+            lambda async_cli: async_cli.create_payments_bulk(items=items, max_workers=2))
+
+        self.assertEqual(len(sent), 4)
+        self.assertIsInstance(res_obj_list[2], Exception)
+        for index in (0, 1, 3):
+            self.assertEqual(res_obj_list[index].status_code, 201)
+            self.assertEqual(res_obj_list[index].request.headers['checkout-nonce'], items[index]["request_id"])
+
+    @unittest.skipIf(pycheckoutcli_async is None, "httpx is not installed")
+    def test_013_async_create_payment_signs_sent_body(self):
+        """Test async create payment sends signed body bytes."""
+        res_obj, sent = self.run_async_cli(lambda async_cli: async_cli.create_payment(request_id='1'))
+
+        self.assertEqual(res_obj.status_code, 201)
+        self.assertEqual(len(sent), 1)
+        request = sent[0]
+        self.assertEqual(request.method, 'POST')
+        self.assertEqual(request.headers['content-type'], 'application/json; charset=utf-8')
+        self.assertEqual(json.loads(request.content)["amount"], 1590)
+        self.assert_signed_request(str(request.url), dict(request.headers), request.content)
+
+    @unittest.skipIf(pycheckoutcli_async is None, "httpx is not installed")
+    def test_014_async_send_request(self):
+        """Test async send request serializes data and raises on error response."""
+        async def test_func(async_cli):
+            await async_cli.send_request(_api_post_url='https://api.checkout.fi/payments', json_body={"a": 1})
+            with self.assertRaises(Exception):
+                await async_cli.send_request(_api_post_url='https://api.checkout.fi/payments',
+                                             json_body=b'{}', **{'checkout-nonce': 'fail'})
+            with self.assertRaises(ValueError):
+                await async_cli.send_request(_api_post_url='')
+
+        _, sent = self.run_async_cli(test_func)
+
+        self.assertEqual(sent[0].content, b'{"a":1}')
+        self.assertEqual(sent[1].content, b'{}')
+
+    @unittest.skipIf(pycheckoutcli_async is None, "httpx is not installed")
+    def test_015_async_list_providers(self):
+        """Test async list providers sends signed GET without body."""
+        res_obj, sent = self.run_async_cli(lambda async_cli: async_cli.list_providers(request_id=7))
+
+        self.assertEqual(res_obj.status_code, 201)
+        request = sent[0]
+        self.assertEqual(request.method, 'GET')
+        self.assertEqual(str(request.url), 'https://api.checkout.fi/merchants/payment-providers')
+        self.assertEqual(request.content, b'')
+        signed_headers = {key: value for key, value in request.headers.items() if key.startswith('checkout-')}
+        self.assertEqual(request.headers['signature'], self.cli.get_hash_sha256(headers=signed_headers))